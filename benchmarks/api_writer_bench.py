@@ -0,0 +1,97 @@
+"""
+Benchmark ApiWriter single-item vs batched mode against a local stub server.
+
+Run from the repository root after `pip install -e .`:
+    python benchmarks/api_writer_bench.py [--count 500] [--batch-size 50]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from drifter_scanner.consumers.api_writer import ApiWriter
+from drifter_scanner.models.drifter_connection import DrifterConnection
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Accepts every POST and records request count and bytes received."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        raw_headers = str(self.headers).encode("latin-1")
+        with self.server.stats_lock:
+            self.server.requests += 1
+            self.server.bytes_in += len(self.requestline) + len(raw_headers) + length
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.stats_lock = threading.Lock()
+    server.requests = 0
+    server.bytes_in = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_connections(count):
+    wormholes = list(DrifterConnection.WORMHOLE_CODES)
+    now = datetime.now()
+    return [DrifterConnection(
+        system=f"J{100000 + i}",
+        drifter_wormhole=wormholes[i % len(wormholes)],
+        seen_at=now,
+    ) for i in range(count)]
+
+
+def run(server, connections, batch_window=None, batch_size=50):
+    server.requests = 0
+    server.bytes_in = 0
+    url = f"http://127.0.0.1:{server.server_port}/drifters/callback/?token=bench"
+    writer = ApiWriter(url, batch_window=batch_window, max_batch_size=batch_size)
+
+    start = time.perf_counter()
+    for connection in connections:
+        writer.on_next(connection)
+    writer.flush()
+    elapsed = time.perf_counter() - start
+    return elapsed, server.requests, server.bytes_in
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=50)
+    args = parser.parse_args()
+
+    server = start_stub()
+    connections = make_connections(args.count)
+
+    # Keep the writer's own log lines out of the report
+    real_stderr, sys.stderr = sys.stderr, open(os.devnull, "w")
+    try:
+        single = run(server, connections)
+        batched = run(server, connections, batch_window=60.0, batch_size=args.batch_size)
+    finally:
+        sys.stderr.close()
+        sys.stderr = real_stderr
+    server.shutdown()
+
+    print(f"{'mode':<10}{'seconds':>10}{'requests':>10}{'items/s':>12}{'bytes':>12}")
+    for name, (elapsed, requests_, bytes_in) in (("single", single), ("batched", batched)):
+        print(f"{name:<10}{elapsed:>10.3f}{requests_:>10}{args.count / elapsed:>12.0f}{bytes_in:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark startup catch-up time against Local log file size.
+
+Compares reading a whole log from the start with seeking to a fixed
+catch-up window with log_index.seek_offset.
+
+Run from the repository root after `pip install -e .`:
+    python benchmarks/catch_up_bench.py [--window 10]
+"""
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from drifter_scanner.producers.log_index import seek_offset
+
+LINE_COUNTS = (10_000, 100_000, 1_000_000)
+LINE_INTERVAL = timedelta(seconds=1)
+
+
+def write_log(path, count, end):
+    start = end - count * LINE_INTERVAL
+    with open(path, "w", encoding="utf-16-le") as f:
+        f.write("﻿\n  Channel Name:    Local\n")
+        for i in range(count):
+            stamp = (start + i * LINE_INTERVAL).strftime("%Y.%m.%d %H:%M:%S")
+            f.write(f"[ {stamp} ] Pilot {i % 500} > o7 anyone seen a drifter hole today\n")
+
+
+def read_from(path, offset):
+    with open(path, "r", encoding="utf-16-le") as f:
+        f.seek(offset)
+        return len(f.readlines())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--window", type=float, default=10, help="catch-up window in minutes")
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    cutoff = now - timedelta(minutes=args.window)
+
+    print(f"{'lines':>10}{'MiB':>8}{'full read s':>14}{'catch-up s':>12}{'lines read':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in LINE_COUNTS:
+            path = Path(tmp) / f"Local_20250101_000000_{count}.txt"
+            write_log(path, count, now)
+
+            start = time.perf_counter()
+            read_from(path, 0)
+            full = time.perf_counter() - start
+
+            start = time.perf_counter()
+            offset = seek_offset(path, cutoff)
+            read = read_from(path, offset)
+            catch_up = time.perf_counter() - start
+
+            size = path.stat().st_size / (1024 * 1024)
+            print(f"{count:>10}{size:>8.1f}{full:>14.4f}{catch_up:>12.4f}{read:>12}")
+
+
+if __name__ == "__main__":
+    main()
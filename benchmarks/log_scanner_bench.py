@@ -0,0 +1,76 @@
+"""
+Benchmark LogScanner per-line cost as the number of event types grows.
+
+Compares the single-pass prefiltered scanner with running every registered
+regex against every line.
+
+Run from the repository root after `pip install -e .`:
+    python benchmarks/log_scanner_bench.py [--lines 100000]
+"""
+import argparse
+import random
+import re
+import time
+
+from drifter_scanner.producers.log_scanner import LogScanner
+
+TYPE_COUNTS = (1, 2, 5, 10, 20, 40)
+
+
+def make_lines(count, jump_ratio=0.01):
+    rng = random.Random(42)
+    lines = []
+    for i in range(count):
+        stamp = f"[ 2025.01.01 {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d} ]"
+        if rng.random() < jump_ratio:
+            lines.append(f"{stamp} EVE System > Channel changed to Local : J{100000 + i}\n")
+        else:
+            lines.append(f"{stamp} Pilot {rng.randint(1, 500)} > o7 anyone seen a drifter hole today\n")
+    return lines
+
+
+def make_types(count):
+    types = [("jump", "Channel changed to Local", r'\[\s*(.+?)\s*\].*Channel changed to Local\s*:\s*(.+)$')]
+    for i in range(1, count):
+        literal = f"Event marker {i:02d}"
+        types.append((f"event{i}", literal, rf'\[\s*(.+?)\s*\].*{literal}\s*:\s*(.+)$'))
+    return types
+
+
+def bench_scanner(lines, types):
+    scanner = LogScanner()
+    for name, literal, pattern in types:
+        scanner.register(name, literal, pattern, lambda match, context: match.group(2))
+    start = time.perf_counter()
+    emitted = scanner.scan(lines)
+    return time.perf_counter() - start, emitted
+
+
+def bench_naive(lines, types):
+    patterns = [re.compile(pattern) for _, _, pattern in types]
+    start = time.perf_counter()
+    emitted = 0
+    for line in lines:
+        for pattern in patterns:
+            if pattern.search(line):
+                emitted += 1
+    return time.perf_counter() - start, emitted
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=100000)
+    args = parser.parse_args()
+
+    lines = make_lines(args.lines)
+    print(f"{'types':>6}{'scanner ns/line':>18}{'naive ns/line':>16}{'events':>9}")
+    for count in TYPE_COUNTS:
+        types = make_types(count)
+        scan_time, emitted = bench_scanner(lines, types)
+        naive_time, naive_emitted = bench_naive(lines, types)
+        assert emitted == naive_emitted
+        print(f"{count:>6}{scan_time / len(lines) * 1e9:>18.0f}{naive_time / len(lines) * 1e9:>16.0f}{emitted:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,13 @@ Wires producers to consumers and manages application lifecycle.
 import json
 import sys
 import threading
+from datetime import timedelta
 from pathlib import Path
 
 from drifter_scanner.state import AppState
 from drifter_scanner.producers.jump_events import JumpEvents
 from drifter_scanner.consumers.logger import StderrLogger
-from drifter_scanner.consumers.spreadsheet_writer import SpreadsheetWriter
 from drifter_scanner.consumers.api_writer import ApiWriter
-from drifter_scanner.auth.google_auth import GoogleSheetsAuth
-from drifter_scanner.ui.system_tray import SystemTray
 from drifter_scanner.ui.log_buffer import LogBuffer
 from drifter_scanner.operators.drifter_connections import detect_drifter_connections
 
@@ -25,8 +23,13 @@ class DrifterScanner:
 
     def __init__(self):
         self.state = AppState()
-        self.jump_events = JumpEvents()
+        self.config = self._load_config()
+        catch_up_minutes = self.config.get("catch_up_minutes")
+        self.jump_events = JumpEvents(
+            catch_up=timedelta(minutes=catch_up_minutes) if catch_up_minutes is not None else None
+        )
         self.scheduler = None
+        self.api_writer = None
         self.tray = None
         self.log_buffer = LogBuffer()
         self.log_buffer.install()
@@ -50,9 +53,12 @@ class DrifterScanner:
 
         # Google Sheets consumer - disabled
         # def init_spreadsheet_writer():
+        #     from drifter_scanner.auth.google_auth import GoogleSheetsAuth
+        #     from drifter_scanner.auth.credential_manager import CredentialManager
+        #     from drifter_scanner.consumers.spreadsheet_writer import SpreadsheetWriter
         #     credentials_file = Path(__file__).parent / "auth" / "credentials.json"
         #     try:
-        #         auth_handler = GoogleSheetsAuth(credentials_file)
+        #         auth_handler = CredentialManager(GoogleSheetsAuth(credentials_file))
         #         spreadsheet_writer = SpreadsheetWriter(auth_handler)
         #         drifter_connections.subscribe(spreadsheet_writer)
         #         print("Spreadsheet writer enabled", file=sys.stderr)
@@ -63,11 +69,15 @@ class DrifterScanner:
         # threading.Thread(target=init_spreadsheet_writer, daemon=True).start()
 
         # API consumer
-        config = self._load_config()
+        config = self.config
         api_url = config.get("api_url")
         if api_url:
-            api_writer = ApiWriter(api_url)
-            drifter_connections.subscribe(api_writer)
+            self.api_writer = ApiWriter(
+                api_url,
+                batch_window=config.get("api_batch_window"),
+                max_batch_size=config.get("api_batch_size", 50),
+            )
+            drifter_connections.subscribe(self.api_writer)
             print(f"API writer enabled: {api_url.split('?')[0]}", file=sys.stderr)
 
         self.scheduler = self.jump_events.start_monitoring(self.state)
@@ -75,6 +85,9 @@ class DrifterScanner:
     def _cleanup(self):
         """Clean up resources."""
         self.state.shutdown()
+        if self.api_writer:
+            # Send connections still waiting in a batch window
+            self.api_writer.flush()
         if self.scheduler:
             self.scheduler.dispose()
         self.log_buffer.uninstall()
@@ -84,6 +97,9 @@ class DrifterScanner:
         self.state.start()
         self._start_workers()
 
+        # Imported here so the offline replay command doesn't need the tray stack
+        from drifter_scanner.ui.system_tray import SystemTray
+
         self.tray = SystemTray(self.state, self.log_buffer)
         tray_thread = threading.Thread(target=self.tray.run, daemon=False)
         tray_thread.start()
@@ -101,6 +117,10 @@ class DrifterScanner:
 
 def main():
     """Main entry point for the application."""
+    if len(sys.argv) > 1 and sys.argv[1] == "replay":
+        from drifter_scanner.replay import main as replay_main
+        return replay_main(sys.argv[2:])
+
     app = DrifterScanner()
     app.run()
     return 0
@@ -0,0 +1,168 @@
+"""
+Shared Google credentials with proactive background refresh.
+"""
+import sys
+import threading
+from datetime import datetime, timezone
+from google.auth.exceptions import RefreshError
+from google.auth.transport.requests import Request
+
+from drifter_scanner.auth.google_auth import GoogleSheetsAuth
+
+
+class CredentialManager:
+    """Shares one set of OAuth2 credentials and refreshes them before they expire.
+
+    The first call to get_credentials loads the token (running the browser
+    flow if needed). After that, callers always get the cached credentials
+    object immediately, while a background thread refreshes it in place a
+    few minutes before expiry and persists the new token. Refreshing in
+    place means clients already holding the credentials pick up the new
+    token without being rebuilt. The credentials' own refresh method is
+    wrapped as well, so a refresh started by a client (gspread does this on
+    a 401) shares the same lock and never runs alongside another one.
+
+    If Google rejects the refresh token, background refreshing stops and the
+    cached credentials and token.json are dropped; the next get_credentials
+    call reloads through GoogleSheetsAuth, which runs the browser flow.
+    Clients built from the old credentials need to be rebuilt after that.
+    """
+
+    REFRESH_MARGIN = 300
+    RETRY_INTERVAL = 60
+
+    def __init__(self, auth_handler: GoogleSheetsAuth, refresh_margin: float = None):
+        """Initialize the credential manager.
+
+        Args:
+            auth_handler: GoogleSheetsAuth used to load and persist the token
+            refresh_margin: Seconds before expiry to refresh (default: REFRESH_MARGIN)
+        """
+        self.auth_handler = auth_handler
+        self.refresh_margin = self.REFRESH_MARGIN if refresh_margin is None else refresh_margin
+        self.credentials = None
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.refresh_thread = None
+
+    def get_credentials(self):
+        """Get the shared credentials, loading them on first use.
+
+        Concurrent first callers wait on the same load instead of each
+        starting their own.
+
+        Raises:
+            FileNotFoundError: If credentials file doesn't exist
+        """
+        creds = self.credentials
+        if creds is not None:
+            return creds
+
+        with self.lock:
+            if self.credentials is None:
+                creds = self.auth_handler.get_credentials()
+                self._guard_refresh(creds)
+                self.credentials = creds
+                self._start_refresh_thread()
+            return self.credentials
+
+    def _start_refresh_thread(self):
+        """Start a refresh thread for the current credentials. Caller holds the lock.
+
+        A thread left over from dropped credentials exits on its own.
+        """
+        self.refresh_thread = threading.Thread(
+            target=self._refresh_loop, args=(self.credentials,), daemon=True
+        )
+        self.refresh_thread.start()
+
+    def _seconds_until_refresh(self, creds):
+        """Seconds until creds are due for refresh, or None if they don't expire."""
+        expiry = creds.expiry
+        if expiry is None:
+            return None
+        # google-auth stores expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds() - self.refresh_margin
+
+    def _refresh_loop(self, creds):
+        """Sleep until the token is about to expire, then refresh it.
+
+        Ends once creds are no longer the shared credentials, e.g. after
+        a rejected refresh token dropped them.
+        """
+        while not self.stop_event.is_set():
+            if self.credentials is not creds:
+                return
+            delay = self._seconds_until_refresh(creds)
+            if delay is None or not creds.refresh_token:
+                return
+            if delay > 0 and self.stop_event.wait(delay):
+                return
+
+            if not self.refresh():
+                self.stop_event.wait(self.RETRY_INTERVAL)
+
+    def refresh(self):
+        """Refresh the shared credentials in place and persist them.
+
+        Returns:
+            True if the refresh succeeded
+        """
+        creds = self.credentials
+        if creds is None:
+            return False
+        try:
+            creds.refresh(Request())
+        except RefreshError as e:
+            if getattr(e, "retryable", False):
+                print(f"Credential refresh failed: {e}", file=sys.stderr)
+            return False
+        except Exception as e:
+            print(f"Credential refresh failed: {e}", file=sys.stderr)
+            return False
+        return True
+
+    def _guard_refresh(self, creds):
+        """Route every refresh of creds through the manager.
+
+        gspread's AuthorizedSession calls creds.refresh() itself on expiry
+        or a 401, so the single-flight lock has to live on the credentials
+        object rather than only in refresh().
+        """
+        original_refresh = creds.refresh
+
+        def refresh(request):
+            waited = not self.lock.acquire(blocking=False)
+            if waited:
+                self.lock.acquire()
+            try:
+                # Another caller refreshed this same object while we waited
+                if waited and creds.valid:
+                    return
+                try:
+                    original_refresh(request)
+                except RefreshError as e:
+                    if not getattr(e, "retryable", False):
+                        self._invalidate(creds, e)
+                    raise
+                self.auth_handler.save_credentials(creds)
+            finally:
+                self.lock.release()
+
+        creds.refresh = refresh
+
+    def _invalidate(self, creds, error):
+        """Drop credentials whose refresh token was rejected. Caller holds the lock.
+
+        The persisted token is removed too; its access token may still look
+        valid, and reloading it would skip the browser flow.
+        """
+        print(f"Credential refresh rejected, sign-in required on next use: {error}", file=sys.stderr)
+        if self.credentials is creds:
+            self.credentials = None
+        self.auth_handler.clear_token()
+
+    def stop(self):
+        """Stop the background refresh thread."""
+        self.stop_event.set()
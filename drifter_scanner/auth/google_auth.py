@@ -1,6 +1,7 @@
 """
 Google OAuth2 authentication for Google Sheets API.
 """
+import os
 import sys
 import json
 from pathlib import Path
@@ -66,14 +67,31 @@ class GoogleSheetsAuth:
             else:
                 creds = self._run_oauth_flow()
 
-            try:
-                with open(self.token_file, 'w') as token:
-                    token.write(creds.to_json())
-            except Exception as e:
-                print(f"Could not save credentials: {e}", file=sys.stderr)
+            self.save_credentials(creds)
 
         return creds
 
+    def save_credentials(self, creds):
+        """Atomically write credentials to the token file.
+
+        The token is written to a temporary file next to it and then moved
+        into place, so a crash mid-write never leaves a truncated token.json.
+        """
+        tmp_file = self.token_file.with_name(self.token_file.name + ".tmp")
+        try:
+            with open(tmp_file, 'w') as token:
+                token.write(creds.to_json())
+            os.replace(tmp_file, self.token_file)
+        except Exception as e:
+            print(f"Could not save credentials: {e}", file=sys.stderr)
+
+    def clear_token(self):
+        """Delete the stored token so the next load runs the browser flow."""
+        try:
+            self.token_file.unlink(missing_ok=True)
+        except Exception as e:
+            print(f"Could not remove credentials: {e}", file=sys.stderr)
+
     def _run_oauth_flow(self):
         """Run the OAuth2 flow in browser."""
         print("Opening browser for authentication...", file=sys.stderr)
@@ -2,41 +2,166 @@
 Event consumer that posts drifter connections to the drifterbearAA API.
 """
 import sys
+import gzip
+import json
+import threading
+from urllib.parse import urlsplit, urlunsplit
 import requests
 from drifter_scanner.models.drifter_connection import DrifterConnection
 
 
 class ApiWriter:
-    """Subscriber that POSTs DrifterConnection events to the drifterbearAA API."""
+    """Subscriber that POSTs DrifterConnection events to the drifterbearAA API.
 
-    def __init__(self, api_url: str):
+    By default every connection is sent as its own POST. When batch_window is
+    set, connections are collected for up to that many seconds (or until
+    max_batch_size is reached) and sent as one gzip-compressed JSON array to
+    the bulk variant of the callback URL. If the server rejects the bulk
+    request, the batch is re-sent one item at a time. Bulk mode is turned
+    off for the rest of the session only when the server says the bulk
+    endpoint is not supported.
+    """
+
+    BULK_PATH = "bulk/"
+    # Responses meaning the server has no usable bulk endpoint
+    BULK_UNSUPPORTED = (400, 404, 405, 415)
+
+    def __init__(self, api_url: str, batch_window: float = None, max_batch_size: int = 50,
+                 scheduler=None):
         """Initialize the API writer.
 
         Args:
             api_url: Full callback URL including ?token= query parameter.
+            batch_window: Seconds to collect connections before sending them
+                as one bulk request (default: None, post each item immediately)
+            max_batch_size: Send a batch early once it holds this many items
+            scheduler: reactivex scheduler that times the batch window
+                (default: None, a wall-clock threading.Timer)
         """
         self.api_url = api_url
+        self.bulk_url = self._bulk_url(api_url)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.scheduler = scheduler
+        self.session = requests.Session()
+        # requests.Session is not thread-safe; the batch timer and the
+        # producer thread can both post
+        self.post_lock = threading.Lock()
+
+        self.pending = []
+        self.lock = threading.Lock()
+        self.timer = None
+        self.bulk_supported = True
+
+    @classmethod
+    def _bulk_url(cls, api_url):
+        """Build the bulk endpoint URL by appending BULK_PATH to the path."""
+        parts = urlsplit(api_url)
+        path = parts.path if parts.path.endswith("/") else parts.path + "/"
+        return urlunsplit(parts._replace(path=path + cls.BULK_PATH))
+
+    @staticmethod
+    def _payload(event):
+        """Build the JSON body for a single connection."""
+        return {
+            "system_name": event.system,
+            "drifter_hole": DrifterConnection.WORMHOLE_CODES.get(event.drifter_wormhole, "?"),
+        }
 
     def on_next(self, event):
         """Handle incoming DrifterConnection events."""
         if isinstance(event, DrifterConnection):
-            wh_code = DrifterConnection.WORMHOLE_CODES.get(event.drifter_wormhole, "?")
-            try:
-                resp = requests.post(self.api_url, json={
-                    "system_name": event.system,
-                    "drifter_hole": wh_code,
+            if self.batch_window is None or not self.bulk_supported:
+                self._post_single(event)
+                return
+
+            batch = None
+            with self.lock:
+                self.pending.append(event)
+                if len(self.pending) >= self.max_batch_size:
+                    batch = self._take_pending()
+                elif self.timer is None:
+                    self.timer = self._start_timer()
+
+            if batch:
+                self._post_batch(batch)
+
+    def _start_timer(self):
+        """Schedule a flush at the end of the batch window. Caller holds the lock."""
+        if self.scheduler is not None:
+            return self.scheduler.schedule_relative(
+                self.batch_window, lambda scheduler, state: self.flush()
+            )
+        timer = threading.Timer(self.batch_window, self.flush)
+        timer.daemon = True
+        timer.start()
+        return timer
+
+    def _take_pending(self):
+        """Detach the pending batch and cancel its timer. Caller holds the lock."""
+        batch = self.pending
+        self.pending = []
+        if self.timer is not None:
+            if self.scheduler is not None:
+                self.timer.dispose()
+            else:
+                self.timer.cancel()
+            self.timer = None
+        return batch
+
+    def flush(self):
+        """Send any pending connections now."""
+        with self.lock:
+            batch = self._take_pending()
+        if batch:
+            self._post_batch(batch)
+
+    def _post_single(self, event):
+        """POST a single connection to the callback URL."""
+        wh_code = DrifterConnection.WORMHOLE_CODES.get(event.drifter_wormhole, "?")
+        try:
+            with self.post_lock:
+                resp = self.session.post(self.api_url, json=self._payload(event), allow_redirects=False)
+            if resp.status_code == 201:
+                print(f"[API] {event.system} -> {wh_code} (created)", file=sys.stderr)
+            else:
+                print(f"[API] {event.system} -> {wh_code} (HTTP {resp.status_code}: {resp.text[:200]})", file=sys.stderr)
+        except Exception as e:
+            print(f"[API] Error posting connection: {e}", file=sys.stderr)
+
+    def _post_batch(self, batch):
+        """POST a batch as one gzip-compressed JSON array, falling back to single posts."""
+        body = gzip.compress(json.dumps([self._payload(event) for event in batch]).encode("utf-8"))
+        try:
+            with self.post_lock:
+                resp = self.session.post(self.bulk_url, data=body, headers={
+                    "Content-Type": "application/json",
+                    "Content-Encoding": "gzip",
                 }, allow_redirects=False)
-                if resp.status_code == 201:
-                    print(f"[API] {event.system} -> {wh_code} (created)", file=sys.stderr)
-                else:
-                    print(f"[API] {event.system} -> {wh_code} (HTTP {resp.status_code}: {resp.text[:200]})", file=sys.stderr)
-            except Exception as e:
-                print(f"[API] Error posting connection: {e}", file=sys.stderr)
+        except Exception as e:
+            print(f"[API] Error posting batch of {len(batch)}: {e}, sending as single posts", file=sys.stderr)
+            for event in batch:
+                self._post_single(event)
+            return
+
+        if resp.status_code in (200, 201):
+            print(f"[API] Batch of {len(batch)} connections (created)", file=sys.stderr)
+            return
+
+        if resp.status_code in self.BULK_UNSUPPORTED:
+            print(f"[API] Bulk not supported (HTTP {resp.status_code}), switching to single posts", file=sys.stderr)
+            self.bulk_supported = False
+        else:
+            print(f"[API] Bulk failed (HTTP {resp.status_code}), sending this batch as single posts", file=sys.stderr)
+        for event in batch:
+            self._post_single(event)
 
     def on_error(self, error):
         """Handle errors."""
+        self.flush()
         print(f"API writer error: {error}", file=sys.stderr)
 
     def on_completed(self):
         """Handle completion."""
+        self.flush()
         print("API writer completed", file=sys.stderr)
@@ -18,7 +18,7 @@ class SpreadsheetWriter:
         """Initialize the spreadsheet writer using OAuth2.
 
         Args:
-            auth_handler: GoogleSheetsAuth instance for authentication
+            auth_handler: GoogleSheetsAuth or CredentialManager instance for authentication
         """
         self.auth_handler = auth_handler
 
@@ -5,24 +5,47 @@ import re
 import sys
 from pathlib import Path
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from reactivex.subject import ReplaySubject
 from reactivex.scheduler import EventLoopScheduler
 
 from drifter_scanner.models.jump_event import JumpEvent
+from drifter_scanner.producers.log_scanner import LogScanner
+from drifter_scanner.producers.log_index import seek_offset
 
 
 class JumpEvents:
     """Produces JumpEvent from EVE log files."""
 
-    def __init__(self, log_dir=None):
+    def __init__(self, log_dir=None, scanner=None, catch_up: timedelta = None):
+        """Initialize the producer.
+
+        Args:
+            log_dir: EVE Chatlogs directory (default: ~/Documents/EVE/logs/Chatlogs)
+            scanner: LogScanner to register the jump event type on (default: a new one)
+            catch_up: On startup, only read lines from this far back instead of
+                whole files (default: None, read everything)
+        """
         if log_dir is None:
             log_dir = Path.home() / "Documents" / "EVE" / "logs" / "Chatlogs"
         self.log_dir = Path(log_dir)
         self.file_positions = {}
+        self.catch_up = catch_up
+        self.catch_up_pending = catch_up is not None
         self.pattern = re.compile(r'\[\s*(.+?)\s*\].*Channel changed to Local\s*:\s*(.+)$')
         self.subject = ReplaySubject(buffer_size=1000)
 
+        # Other event types can register on the same scanner to be
+        # classified in the same pass over the Local logs
+        self.scanner = scanner if scanner is not None else LogScanner()
+        self.scanner.register(
+            "jump",
+            "Channel changed to Local",
+            self.pattern,
+            self._extract_jump,
+            subject=self.subject
+        )
+
     def get_latest_local_files(self):
         """Get the latest Local log file for each character."""
         files = defaultdict(list)
@@ -37,8 +60,10 @@ class JumpEvents:
 
     def read_new_lines(self, file_path):
         """Read new lines from file since last position."""
-        pos = self.file_positions.get(file_path, 0)
         try:
+            pos = self.file_positions.get(file_path)
+            if pos is None:
+                pos = self._initial_position(file_path)
             with open(file_path, 'r', encoding='utf-16-le') as f:
                 f.seek(pos)
                 lines = f.readlines()
@@ -48,31 +73,46 @@ class JumpEvents:
             print(f"Error reading {file_path}: {e}")
             return []
 
-    def process_line(self, line, char_id):
-        """Extract timestamp and system name from line and emit JumpEvent."""
-        match = self.pattern.search(line)
-        if match:
-            timestamp_str = match.group(1)
-            system = match.group(2).strip()
+    def _initial_position(self, file_path):
+        """Get where to start reading a file seen for the first time.
 
-            try:
-                visited_at = datetime.strptime(timestamp_str, "%Y.%m.%d %H:%M:%S")
-            except ValueError:
-                visited_at = datetime.now()
+        During the startup catch-up, skip to the first line inside the
+        catch-up window. Files that appear later are read from the start.
+        """
+        if not self.catch_up_pending:
+            return 0
+
+        # EVE log timestamps are UTC
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - self.catch_up
+        return seek_offset(file_path, cutoff)
 
-            self.subject.on_next(JumpEvent(
-                system=system,
-                character_id=char_id,
-                visited_at=visited_at
-            ))
+    def _extract_jump(self, match, char_id):
+        """Build a JumpEvent from a matched Local channel change line."""
+        timestamp_str = match.group(1)
+        system = match.group(2).strip()
+
+        try:
+            visited_at = datetime.strptime(timestamp_str, "%Y.%m.%d %H:%M:%S")
+        except ValueError:
+            visited_at = datetime.now()
+
+        return JumpEvent(
+            system=system,
+            character_id=char_id,
+            visited_at=visited_at
+        )
+
+    def process_line(self, line, char_id):
+        """Extract timestamp and system name from line and emit JumpEvent."""
+        self.scanner.scan([line], char_id)
 
     def run_once(self):
         """Run one iteration of monitoring."""
         current_files = self.get_latest_local_files()
         for char_id, file_path in current_files.items():
             lines = self.read_new_lines(file_path)
-            for line in lines:
-                self.process_line(line, char_id)
+            self.scanner.scan(lines, char_id)
+        self.catch_up_pending = False
 
     def start_monitoring(self, state):
         """Start the monitoring loop on a scheduler."""
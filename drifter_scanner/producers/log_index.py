@@ -0,0 +1,108 @@
+"""
+Timestamp seek for large EVE log files.
+"""
+import re
+from datetime import datetime
+from pathlib import Path
+
+TIMESTAMP = re.compile(r'^\ufeff?\[\s*(\d{4}\.\d\d\.\d\d \d\d:\d\d:\d\d)\s*\]')
+
+BLOCK_SIZE = 64 * 1024
+READ_SIZE = 8 * 1024
+NEWLINE = "\n".encode("utf-16-le")
+
+
+def parse_timestamp(line):
+    """Parse the leading [ YYYY.MM.DD HH:MM:SS ] stamp of a log line.
+
+    Returns:
+        Naive UTC datetime, or None if the line has no valid stamp
+    """
+    match = TIMESTAMP.match(line)
+    if match is None:
+        return None
+    try:
+        return datetime.strptime(match.group(1), "%Y.%m.%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+def seek_offset(path, cutoff: datetime):
+    """Get the byte offset of the first line stamped at or after cutoff.
+
+    Binary-searches the UTF-16-LE file's byte range by line timestamp down
+    to BLOCK_SIZE, then scans the remaining block line by line.
+
+    Returns:
+        Byte offset of that line, or the file size if there is none yet
+    """
+    path = Path(path)
+    size = path.stat().st_size
+
+    with open(path, 'rb') as f:
+        lo, hi = 0, size
+        while hi - lo > BLOCK_SIZE:
+            mid = (lo + hi) // 2 & ~1
+            probe = _probe(f, mid, hi)
+            if probe is None or probe[1] >= cutoff:
+                hi = mid
+            else:
+                lo = probe[0]
+
+        for offset, line in _iter_lines(f, lo):
+            timestamp = _parse_raw_timestamp(line)
+            if timestamp is not None and timestamp >= cutoff:
+                return offset
+    return size
+
+
+def _probe(f, pos, limit):
+    """Find the first timestamped line starting after pos and before limit.
+
+    Returns:
+        (offset, timestamp), or None if there is none
+    """
+    lines = _iter_lines(f, pos)
+    next(lines, None)  # pos is usually mid-line
+    for offset, line in lines:
+        if offset >= limit:
+            return None
+        timestamp = _parse_raw_timestamp(line)
+        if timestamp is not None:
+            return offset, timestamp
+    return None
+
+
+def _iter_lines(f, offset):
+    """Yield (offset, raw line) pairs starting at offset."""
+    f.seek(offset)
+    buffer = b""
+    while True:
+        chunk = f.read(READ_SIZE)
+        if not chunk:
+            if buffer:
+                yield offset, buffer
+            return
+        buffer += chunk
+
+        start = 0
+        end = _find_newline(buffer, start)
+        while end != -1:
+            end += len(NEWLINE)
+            yield offset, buffer[start:end]
+            offset += end - start
+            start = end
+            end = _find_newline(buffer, start)
+        buffer = buffer[start:]
+
+
+def _find_newline(data, start):
+    """Find an encoded newline aligned to a UTF-16 code unit."""
+    i = data.find(NEWLINE, start)
+    while i != -1 and (i - start) % 2:
+        i = data.find(NEWLINE, i + 1)
+    return i
+
+
+def _parse_raw_timestamp(line):
+    return parse_timestamp(line.decode('utf-16-le', errors='replace'))
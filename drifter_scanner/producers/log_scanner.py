@@ -0,0 +1,108 @@
+"""
+Single-pass multi-pattern scanner for EVE log lines.
+"""
+import re
+from collections import defaultdict
+from reactivex.subject import Subject
+
+
+class LogScanner:
+    """Classifies log lines against registered event types in one pass.
+
+    Each event type registers a literal that must appear in any line it can
+    match, a regex that parses the line, and an extractor that turns the regex
+    match into an event. All literals are combined into one prefilter that is
+    run over the whole buffer, so lines containing none of them never reach
+    Python code and the per-line cost stays flat as event types are added.
+    The prefilter only gates lines; on a hit line each literal is checked
+    and only the regexes of the literals found in it are run.
+    """
+
+    def __init__(self):
+        self.event_types = {}
+        self.types_by_literal = defaultdict(list)
+        self.prefilter = None
+
+    def register(self, name, literal, pattern, extractor, subject=None):
+        """Register an event type and return the observable it emits on.
+
+        Args:
+            name: Unique name of the event type
+            literal: Plain text that appears in every line this type can match
+            pattern: Regex (string or compiled) run on lines containing literal
+            extractor: Callable (match, context) -> event, or None to drop the line
+            subject: Subject to emit events on (default: a new Subject)
+        """
+        if name in self.event_types:
+            raise ValueError(f"Event type already registered: {name}")
+        if not literal:
+            raise ValueError(f"Event type {name} needs a non-empty literal")
+
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        if subject is None:
+            subject = Subject()
+
+        self.event_types[name] = (pattern, extractor, subject)
+        self.types_by_literal[literal].append(name)
+        self.prefilter = None
+        return subject
+
+    def get_observable(self, name):
+        """Get the observable for a registered event type."""
+        return self.event_types[name][2]
+
+    def _get_prefilter(self):
+        """Build (once per registration change) the combined literal prefilter."""
+        if self.prefilter is None:
+            literals = sorted(self.types_by_literal, key=len, reverse=True)
+            self.prefilter = re.compile("|".join(re.escape(lit) for lit in literals))
+        return self.prefilter
+
+    def scan(self, lines, context=None):
+        """Classify lines and route extracted events to their observables.
+
+        Args:
+            lines: Iterable of log lines, as returned by readlines()
+            context: Passed through to every extractor (e.g. the character id)
+
+        Returns:
+            Number of events emitted
+        """
+        if not self.event_types:
+            return 0
+
+        text = "".join(lines)
+        prefilter = self._get_prefilter()
+        emitted = 0
+
+        match = prefilter.search(text)
+        while match:
+            line_start = text.rfind("\n", 0, match.start()) + 1
+            line_end = text.find("\n", match.end())
+            if line_end == -1:
+                line_end = len(text)
+            emitted += self._dispatch(text[line_start:line_end], context)
+            match = prefilter.search(text, line_end)
+        return emitted
+
+    def _dispatch(self, line, context):
+        """Run the regexes of the event types whose literals appear in line.
+
+        The prefilter only says that some literal is present; overlapping
+        literals (one a prefix of another, say) hide each other from a
+        single regex pass, so every literal is checked against the line.
+        """
+        emitted = 0
+        for literal, names in self.types_by_literal.items():
+            if literal not in line:
+                continue
+            for name in names:
+                pattern, extractor, subject = self.event_types[name]
+                match = pattern.search(line)
+                if match:
+                    event = extractor(match, context)
+                    if event is not None:
+                        subject.on_next(event)
+                        emitted += 1
+        return emitted
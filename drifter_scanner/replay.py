@@ -0,0 +1,325 @@
+"""
+Replay recorded Chatlogs through the live pipeline on virtual time.
+
+Lines from a directory of recorded Local logs are scheduled at their own
+timestamps on a HistoricalScheduler and fed into the real JumpEvents ->
+detect_drifter_connections -> ApiWriter chain. The ApiWriter posts to a
+local stub server, so a replay never leaves the machine.
+
+Usage:
+    python -m drifter_scanner replay <chatlogs dir> [--speed max|N] [--batch-window S]
+    python -m drifter_scanner.replay <chatlogs dir> [...]
+"""
+import argparse
+import gzip
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from reactivex.scheduler import HistoricalScheduler
+
+from drifter_scanner.producers.jump_events import JumpEvents
+from drifter_scanner.producers.log_index import parse_timestamp
+from drifter_scanner.consumers.api_writer import ApiWriter
+from drifter_scanner.operators.drifter_connections import detect_drifter_connections
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Accepts every POST and counts requests and connections received."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        payload = json.loads(body)
+        items = len(payload) if isinstance(payload, list) else 1
+
+        with self.server.stats_lock:
+            self.server.requests += 1
+            self.server.items += items
+
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubApiServer:
+    """Local stand-in for the drifterbearAA callback endpoint."""
+
+    def __init__(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self.server.stats_lock = threading.Lock()
+        self.server.requests = 0
+        self.server.items = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_port}/drifters/callback/?token=replay"
+
+    @property
+    def requests(self):
+        return self.server.requests
+
+    @property
+    def items(self):
+        return self.server.items
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _TimedConsumer:
+    """Observer wrapper that records how long the wrapped consumer takes."""
+
+    def __init__(self, consumer, timings):
+        self.consumer = consumer
+        self.timings = timings
+
+    def on_next(self, event):
+        start = time.perf_counter()
+        self.consumer.on_next(event)
+        self.timings.append(time.perf_counter() - start)
+
+    def on_error(self, error):
+        self.consumer.on_error(error)
+
+    def on_completed(self):
+        self.consumer.on_completed()
+
+
+class _TimedApiWriter(ApiWriter):
+    """ApiWriter that records how long each bulk POST takes.
+
+    In batched mode the POSTs happen in flush(), which the scheduler runs
+    outside on_next, so the consume timings alone would miss them.
+    """
+
+    def __init__(self, *args, timings, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = timings
+
+    def _post_batch(self, batch):
+        start = time.perf_counter()
+        super()._post_batch(batch)
+        self.timings.append(time.perf_counter() - start)
+
+
+class Replay:
+    """Drives recorded Local logs through the pipeline on a virtual clock."""
+
+    TICK = 0.01
+
+    def __init__(self, log_dir, speed: float = None, batch_window: float = None):
+        """Initialize the replay.
+
+        Args:
+            log_dir: Directory of recorded Local_*.txt Chatlogs
+            speed: Virtual seconds per wall second (default: None, as fast as possible)
+            batch_window: Replay ApiWriter in batched mode with this window,
+                in virtual seconds
+        """
+        self.log_dir = Path(log_dir)
+        self.speed = speed
+        self.batch_window = batch_window
+
+        self.jump_events = JumpEvents(self.log_dir)
+        self.scheduler = None
+        self.first_time = None
+        self.last_time = None
+
+        self.counts = defaultdict(int)
+        self.timings = defaultdict(list)
+        self.line_started = 0.0
+        self.last_jump_at = 0.0
+        self.wall_start = 0.0
+        self.consumer = None
+
+    def _read_lines(self):
+        """Yield (timestamp, char_id, line) for every line of every Local log.
+
+        Lines without their own timestamp inherit the previous one; header
+        lines before the first timestamp are skipped.
+        """
+        for path in sorted(self.log_dir.glob("Local_*.txt")):
+            parts = path.stem.split('_')
+            if len(parts) < 3:
+                continue
+            char_id = parts[-1]
+
+            timestamp = None
+            with open(path, 'r', encoding='utf-16-le') as f:
+                for line in f:
+                    timestamp = parse_timestamp(line) or timestamp
+                    if timestamp is not None:
+                        yield timestamp, char_id, line
+
+    def load(self):
+        """Schedule every recorded line at its timestamp.
+
+        Returns:
+            Number of lines scheduled
+        """
+        entries = list(self._read_lines())
+        if not entries:
+            return 0
+
+        self.first_time = min(entry[0] for entry in entries)
+        self.last_time = max(entry[0] for entry in entries)
+        self.scheduler = HistoricalScheduler(initial_clock=self.first_time)
+
+        for timestamp, char_id, line in entries:
+            self.scheduler.schedule_absolute(timestamp, self._feed_line, (timestamp, char_id, line))
+        return len(entries)
+
+    def _feed_line(self, scheduler, state):
+        timestamp, char_id, line = state
+        if self.speed is not None:
+            due = self.wall_start + (timestamp - self.first_time).total_seconds() / self.speed
+            self.timings["schedule lag"].append(max(0.0, time.perf_counter() - due))
+
+        self.line_started = time.perf_counter()
+        self.jump_events.process_line(line, char_id)
+        self.timings["line total"].append(time.perf_counter() - self.line_started)
+        self.counts["lines"] += 1
+
+    def _on_jump(self, event):
+        self.last_jump_at = time.perf_counter()
+        self.timings["scan"].append(self.last_jump_at - self.line_started)
+        self.counts["jump events"] += 1
+
+    def _on_connection(self, event):
+        self.timings["detect"].append(time.perf_counter() - self.last_jump_at)
+        self.counts["connections"] += 1
+        self.consumer.on_next(event)
+
+    def _advance(self):
+        """Run the scheduled lines, in real time scaled by speed or all at once."""
+        if self.speed is None:
+            self.scheduler.start()
+            return
+
+        while True:
+            elapsed = timedelta(seconds=(time.perf_counter() - self.wall_start) * self.speed)
+            target = min(self.first_time + elapsed, self.last_time)
+            self.scheduler.advance_to(target)
+            if target >= self.last_time:
+                return
+            time.sleep(self.TICK)
+
+    def run(self, api_url):
+        """Run the replay against api_url and return a report dict."""
+        jump_stream = self.jump_events.get_observable()
+        jump_stream.subscribe(on_next=self._on_jump)
+
+        # One subscription, as in the live app; a second one would build a
+        # second detection chain and detect every jump twice
+        api_writer = _TimedApiWriter(
+            api_url,
+            batch_window=self.batch_window,
+            scheduler=self.scheduler,
+            timings=self.timings["bulk post"]
+        )
+        self.consumer = _TimedConsumer(api_writer, self.timings["consume"])
+        jump_stream.pipe(detect_drifter_connections()).subscribe(on_next=self._on_connection)
+
+        self.wall_start = time.perf_counter()
+        self._advance()
+        api_writer.flush()
+        wall = time.perf_counter() - self.wall_start
+
+        return {
+            "wall seconds": wall,
+            "virtual seconds": (self.last_time - self.first_time).total_seconds(),
+            "lines/s": self.counts["lines"] / wall if wall else 0.0,
+            "counts": dict(self.counts),
+            "timings": {stage: values for stage, values in self.timings.items() if values},
+        }
+
+
+def _format_report(report, stub):
+    """Render a replay report for the terminal."""
+    lines = [
+        f"Replayed {report['virtual seconds']:.0f}s of logs in {report['wall seconds']:.3f}s "
+        f"({report['lines/s']:.0f} lines/s)",
+        "",
+        "Counts:",
+    ]
+    for name in ("lines", "jump events", "connections"):
+        lines.append(f"  {name:<14}{report['counts'].get(name, 0):>10}")
+    lines.append(f"  {'api requests':<14}{stub.requests:>10}")
+    lines.append(f"  {'api items':<14}{stub.items:>10}")
+
+    lines += ["", f"{'Stage latency (ms)':<20}{'count':>8}{'mean':>10}{'p50':>10}{'p95':>10}{'max':>10}"]
+    for stage in ("schedule lag", "scan", "detect", "consume", "bulk post", "line total"):
+        values = report["timings"].get(stage)
+        if not values:
+            continue
+        ordered = sorted(values)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        lines.append(
+            f"{stage:<20}{len(values):>8}{statistics.fmean(values) * 1e3:>10.3f}"
+            f"{statistics.median(ordered) * 1e3:>10.3f}{p95 * 1e3:>10.3f}{ordered[-1] * 1e3:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_speed(value):
+    if value == "max":
+        return None
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("speed must be positive or 'max'")
+    return speed
+
+
+def main(argv=None):
+    """Entry point for the replay command."""
+    parser = argparse.ArgumentParser(prog="drifter-scanner replay", description="Replay recorded Chatlogs offline.")
+    parser.add_argument("log_dir", type=Path, help="directory of recorded Local_*.txt logs")
+    parser.add_argument("--speed", type=_parse_speed, default=None,
+                        help="virtual seconds per wall second, or 'max' (default)")
+    parser.add_argument("--batch-window", type=float, default=None,
+                        help="replay ApiWriter in batched mode with this window in virtual seconds")
+    parser.add_argument("--verbose", action="store_true", help="show consumer log output")
+    args = parser.parse_args(argv)
+
+    replay = Replay(args.log_dir, speed=args.speed, batch_window=args.batch_window)
+    if replay.load() == 0:
+        print(f"No timestamped Local logs found in {args.log_dir}", file=sys.stderr)
+        return 1
+
+    stub = StubApiServer()
+    stub.start()
+
+    real_stderr = sys.stderr
+    if not args.verbose:
+        sys.stderr = open(os.devnull, "w")
+    try:
+        report = replay.run(stub.url)
+    finally:
+        if sys.stderr is not real_stderr:
+            sys.stderr.close()
+            sys.stderr = real_stderr
+        stub.stop()
+
+    print(_format_report(report, stub))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,8 +25,8 @@ class CallbackUrlDialog:
         with open(CONFIG_PATH, "w") as f:
             json.dump(config, f, indent=2)
 
-    def show(self):
-        """Show the callback URL dialog."""
+    def show(self, root):
+        """Show the callback URL dialog as a Toplevel of root. Must run on the UI thread."""
         if self.window and self.window.winfo_exists():
             self.window.lift()
             self.window.focus_force()
@@ -35,14 +35,14 @@ class CallbackUrlDialog:
         config = self._load_config()
         current_url = config.get("api_url", "")
 
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(root)
         self.window.title("Set Callback URL")
         self.window.geometry("500x150")
         self.window.resizable(False, False)
 
         tk.Label(self.window, text="Callback URL:").pack(anchor="w", padx=10, pady=(10, 0))
 
-        url_var = tk.StringVar(value=current_url)
+        url_var = tk.StringVar(self.window, value=current_url)
         entry = tk.Entry(self.window, textvariable=url_var, width=70)
         entry.pack(padx=10, pady=5)
         entry.select_range(0, tk.END)
@@ -65,5 +65,3 @@ class CallbackUrlDialog:
         btn_frame.pack(pady=5)
         tk.Button(btn_frame, text="Save", command=save, width=10).pack(side="left", padx=5)
         tk.Button(btn_frame, text="Close", command=self.window.destroy, width=10).pack(side="left", padx=5)
-
-        self.window.mainloop()
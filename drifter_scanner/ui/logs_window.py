@@ -13,6 +13,7 @@ class LogsWindow:
         self.window = None
         self.text_area = None
         self.last_length = 0
+        self.refresh_job = None
 
     def refresh_logs(self):
         """Refresh the logs display."""
@@ -28,18 +29,29 @@ class LogsWindow:
             self.text_area.config(state=tk.DISABLED)
             self.last_length = len(logs)
 
-        self.window.after(500, self.refresh_logs)
+        self.refresh_job = self.window.after(500, self.refresh_logs)
 
-    def show(self):
-        """Show the logs window."""
+    def _on_destroy(self, event):
+        """Cancel the pending refresh when the window goes away.
+
+        Destroying the Toplevel deletes the Tcl command behind the pending
+        after() callback, which would otherwise fail once the root outlives it.
+        """
+        if str(event.widget) == str(self.window) and self.refresh_job is not None:
+            self.window.after_cancel(self.refresh_job)
+            self.refresh_job = None
+
+    def show(self, root):
+        """Show the logs window as a Toplevel of root. Must run on the UI thread."""
         if self.window and self.window.winfo_exists():
             self.window.lift()
             self.window.focus_force()
             return
 
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(root)
         self.window.title("Drifter Scanner - Logs")
         self.window.geometry("800x600")
+        self.window.bind("<Destroy>", self._on_destroy)
 
         self.text_area = scrolledtext.ScrolledText(
             self.window,
@@ -56,5 +68,4 @@ class LogsWindow:
         self.text_area.config(state=tk.DISABLED)
         self.last_length = len(logs)
 
-        self.window.after(500, self.refresh_logs)
-        self.window.mainloop()
+        self.refresh_job = self.window.after(500, self.refresh_logs)
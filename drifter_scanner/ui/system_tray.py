@@ -2,13 +2,13 @@
 System tray menu management.
 """
 import sys
-import threading
 from pathlib import Path
 from PIL import Image
 import pystray
 
 from drifter_scanner.ui.logs_window import LogsWindow
 from drifter_scanner.ui.callback_url_dialog import CallbackUrlDialog
+from drifter_scanner.ui.ui_thread import UiThread
 
 
 class SystemTray:
@@ -20,6 +20,7 @@ class SystemTray:
         self.icon = None
         self.logs_window = None
         self.callback_url_dialog = CallbackUrlDialog()
+        self.ui_thread = UiThread()
         if log_buffer:
             self.logs_window = LogsWindow(log_buffer)
 
@@ -41,15 +42,16 @@ class SystemTray:
     def on_logs(self, icon, item):
         """Handle logs action."""
         if self.logs_window:
-            threading.Thread(target=self.logs_window.show, daemon=True).start()
+            self.ui_thread.submit(self.logs_window.show)
 
     def on_set_callback_url(self, icon, item):
         """Handle set callback URL action."""
-        threading.Thread(target=self.callback_url_dialog.show, daemon=True).start()
+        self.ui_thread.submit(self.callback_url_dialog.show)
 
     def on_quit(self, icon, item):
         """Handle quit action."""
         self.app_state.shutdown()
+        self.ui_thread.stop()
         icon.stop()
 
     def create_menu(self):
@@ -63,11 +65,13 @@ class SystemTray:
 
     def stop(self):
         """Stop the system tray."""
+        self.ui_thread.stop()
         if self.icon:
             self.icon.stop()
 
     def run(self):
         """Run the system tray."""
+        self.ui_thread.start()
         icon_image = self.load_icon_image()
         self.icon = pystray.Icon(
             "drifter_scanner",
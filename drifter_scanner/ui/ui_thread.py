@@ -0,0 +1,72 @@
+"""
+Single UI thread hosting all Tk windows.
+"""
+import queue
+import sys
+import threading
+import tkinter as tk
+
+
+class UiThread:
+    """Owns one hidden Tk root and runs window callbacks on its thread.
+
+    Tk is not safe to drive from several threads, so other threads hand
+    work over with submit(); the UI thread drains the queue from its
+    mainloop. Windows are opened as Toplevels of the shared root.
+    """
+
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self):
+        self.root = None
+        self.tasks = queue.Queue()
+        self.thread = None
+        self.ready = threading.Event()
+
+    def start(self):
+        """Start the UI thread and wait until its Tk root exists."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            self.ready.wait()
+
+    def submit(self, func, *args):
+        """Run func(root, *args) on the UI thread."""
+        self.tasks.put((func, args))
+
+    def stop(self):
+        """Close all windows and end the UI thread."""
+        self.tasks.put(None)
+
+    def _run(self):
+        try:
+            self.root = tk.Tk()
+        except Exception as e:
+            print(f"UI unavailable: {e}", file=sys.stderr)
+            self.ready.set()
+            return
+
+        self.root.withdraw()
+        self.ready.set()
+        self.root.after(self.POLL_INTERVAL_MS, self._drain)
+        self.root.mainloop()
+
+    def _drain(self):
+        """Run queued tasks, then poll again."""
+        while True:
+            try:
+                task = self.tasks.get_nowait()
+            except queue.Empty:
+                break
+
+            if task is None:
+                self.root.destroy()
+                return
+
+            func, args = task
+            try:
+                func(self.root, *args)
+            except Exception as e:
+                print(f"UI error: {e}", file=sys.stderr)
+
+        self.root.after(self.POLL_INTERVAL_MS, self._drain)